@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import sys
+import os
+from typing import Dict, Optional
+
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+# Add the project root to sys.path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from imports.serial_commander.utils.command_parser import parse_response
+from imports.serial_commander.config.config_loader import load_esp32config
+from imports.serial_commander.serial_communication import _RESPONSE_TOKEN
+
+class AsyncSerialCommunication(asyncio.Protocol):
+    def __init__(self, config: Optional[Dict] = None, logger: Optional[logging.Logger] = None):
+        """Initialize asyncio-based serial communication.
+
+        Requires the optional pyserial-asyncio package.
+
+        Args:
+            config: UART configuration (default: ESP32_UART_CONFIG from esp32_config.json)
+            logger: Optional logger instance
+        """
+        self.transport = None
+        self.last_response = None
+        self.logger = logger or logging.getLogger(__name__)
+        self.uart_config = config or dict(load_esp32config()['ESP32_UART_CONFIG'])
+        self._term_bytes = self.uart_config['LINE_TERMINATOR'].encode('utf-8')
+        self._buffer = bytearray()
+        # Search state into _buffer so each callback only scans newly received bytes
+        self._token_pos = -1
+        self._scan_pos = 0
+        self._response_future = None
+        self._lock = None
+
+    async def open_serial(self, port: str = None) -> None:
+        """
+        Open serial connection if not already open.
+
+        Args:
+            port: Optional port name (default: None)
+
+        Raises:
+            ImportError: If pyserial-asyncio is not installed
+        """
+        if serial_asyncio is None:
+            raise ImportError("pyserial-asyncio is required for AsyncSerialCommunication")
+
+        if port is None:
+            port = self.uart_config['DEFAULT_PORT']
+
+        if self.transport is None or self.transport.is_closing():
+            # connection_made is only scheduled on the loop, so take the transport from
+            # the return value rather than waiting for the callback to set it
+            transport, _ = await serial_asyncio.create_serial_connection(
+                asyncio.get_running_loop(),
+                lambda: self,
+                port,
+                baudrate=self.uart_config['BAUD_RATE'],
+                rtscts=False,
+                dsrdtr=False  # Disable hardware flow control
+            )
+            self.transport = transport
+
+            self.transport.serial.dtr = False
+            self.transport.serial.rts = False
+
+            # Wait for ESP32 to stabilize, then drop whatever it printed while booting
+            await asyncio.sleep(self.uart_config['ESP32_BOOT_DELAY'])
+            self._reset_buffer()
+
+            self.logger.info(f"Serial port {port} opened successfully")
+
+    def close_serial(self) -> None:
+        """Close serial connection if open."""
+        if self.transport is not None and not self.transport.is_closing():
+            self.transport.close()
+            self.logger.info("Serial port closed")
+
+    def connection_made(self, transport) -> None:
+        """Store the transport once the serial connection is established."""
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        """Buffer incoming bytes and resolve the pending command once its response line is complete.
+
+        Unsolicited output received while no command is pending is discarded, so the
+        buffer cannot grow on a long-lived idle connection.
+        """
+        future = self._response_future
+        if future is None or future.done():
+            return
+
+        self._buffer.extend(data)
+
+        # Search only the newly received bytes (plus overlap): first for the header,
+        # then for the terminator that closes its line
+        if self._token_pos == -1:
+            self._token_pos = self._buffer.find(_RESPONSE_TOKEN, self._scan_pos)
+            if self._token_pos == -1:
+                self._scan_pos = max(0, len(self._buffer) - len(_RESPONSE_TOKEN) + 1)
+                return
+            self._scan_pos = self._token_pos
+
+        if self._buffer.find(self._term_bytes, self._scan_pos) == -1:
+            self._scan_pos = max(self._token_pos, len(self._buffer) - len(self._term_bytes) + 1)
+            return
+
+        future.set_result(self._buffer.decode('utf-8', errors='ignore'))
+        self._reset_buffer()
+
+    def _reset_buffer(self) -> None:
+        """Discard buffered input along with its search state."""
+        self._buffer.clear()
+        self._token_pos = -1
+        self._scan_pos = 0
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        """Fail any pending command when the port goes away."""
+        self.transport = None
+        future = self._response_future
+        if future is not None and not future.done():
+            future.set_exception(exc or ConnectionError("Serial connection lost"))
+
+    async def send_command(self, command: str) -> bool:
+        """Send command over serial and wait for its response without blocking the event loop.
+
+        Concurrent callers are queued, since the protocol has no way to pair
+        interleaved responses with their commands.
+
+        Args:
+            command: Command to send
+
+        Returns:
+            bool: True if command was successful, False otherwise
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            try:
+                if self.transport is None or self.transport.is_closing():
+                    await self.open_serial()
+
+                self.logger.debug("Sending command: [%s]", command)
+
+                self._reset_buffer()
+                self._response_future = asyncio.get_running_loop().create_future()
+                self.transport.write(command.encode('utf-8') + self._term_bytes)
+
+                response = await asyncio.wait_for(self._response_future, self.uart_config['TIMEOUT'])
+            except asyncio.TimeoutError:
+                self.logger.warning(f"No response received for command: {command}")
+                return False
+            except Exception as e:
+                self.logger.error(f"Unexpected error in serial communication: {str(e)}")
+                return False
+            finally:
+                self._response_future = None
+
+            self.last_response = response
+            return self._parse_response(response)
+
+    def _parse_response(self, response: str) -> bool:
+        """Parse and verify response using the parser.
+
+        Args:
+            response: Response string to parse
+
+        Returns:
+            bool: True if parsing was successful and status is OK, False otherwise
+        """
+        parsed = parse_response(response, self.logger)
+
+        if parsed:
+            self.logger.debug("Parsed response: %s", parsed)
+            if parsed['status'] == 'OK':
+                return True
+            self.logger.warning(f"Response status is not OK: {parsed['status']}")
+        else:
+            self.logger.error("Failed to parse response. No valid data returned.")
+
+        return False
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.open_serial()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        self.close_serial()
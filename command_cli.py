@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import sys
+import json
 import logging
 import argparse
 import os
@@ -20,16 +21,36 @@ def setup_logging(level: int = logging.INFO) -> None:
         datefmt='%H:%M:%S'
     )
 
+def run_daemon(sender: SerialCommunication) -> None:
+    """Send one command per stdin line over a single open connection.
+
+    Each result is printed to stdout as a JSON line.
+    """
+    with sender:
+        for line in sys.stdin:
+            command = line.strip()
+            if not command:
+                continue
+
+            sender.last_response = None
+            success = sender.send_command(command)
+            print(json.dumps({
+                'command': command,
+                'success': success,
+                'response': sender.last_response
+            }), flush=True)
+
 def main() -> None:
     """Command-line interface for serial communication."""
-    config = load_esp32config().get('ESP32_UART_CONFIG')
+    config = dict(load_esp32config().get('ESP32_UART_CONFIG'))
 
     parser = argparse.ArgumentParser(
         description="Send text messages over serial port and receive responses"
     )
     parser.add_argument(
         "message",
-        help="Text message to send"
+        nargs="?",
+        help="Text message to send (omit when using --daemon)"
     )
     parser.add_argument(
         "-p", "--port",
@@ -47,8 +68,16 @@ def main() -> None:
         action="store_true",
         help="Enable verbose logging"
     )
+    parser.add_argument(
+        "-d", "--daemon", "--stdin",
+        dest="daemon",
+        action="store_true",
+        help="Keep the port open and send one command per line read from stdin"
+    )
 
     args = parser.parse_args()
+    if not args.daemon and args.message is None:
+        parser.error("message is required unless --daemon is given")
 
     # Setup logging
     setup_logging(level=logging.DEBUG if args.verbose else logging.INFO)
@@ -61,6 +90,10 @@ def main() -> None:
         max_retries=0,
     )
 
+    if args.daemon:
+        run_daemon(sender)
+        sys.exit(0)
+
     # Send message and get response
     success = sender.send_command(args.message)
 
@@ -1,10 +1,15 @@
 import json
 import os
+from functools import lru_cache
 from typing import Dict  # Import Dict for type hinting
 
+@lru_cache(maxsize=None)
 def load_config(config_file: str) -> Dict:
     """Load the configuration from the config_file file.
 
+    The parsed result is cached, so the file is only read once per process. The
+    returned dict is shared between callers and must not be mutated.
+
     Args:
         config_file (str): The path to the configuration file.
 
@@ -25,9 +30,13 @@ def load_config(config_file: str) -> Dict:
     except json.JSONDecodeError as e:
         raise json.JSONDecodeError(f"Invalid JSON in config file: {config_path}", e.doc, e.pos)
 
+@lru_cache(maxsize=None)
 def load_esp32config() -> Dict:
     """Load and validate ESP32 configuration.
 
+    The result is cached and shared by every caller, so it must not be mutated;
+    copy a section (e.g. dict(config['ESP32_UART_CONFIG'])) before changing it.
+
     Returns:
         Dict: Validated configuration
 
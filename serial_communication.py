@@ -2,6 +2,8 @@ import serial
 import argparse
 import sys
 import time
+import random
+import select
 import logging
 from typing import Any, Optional, Dict
 from serial.tools import list_ports
@@ -15,24 +17,38 @@ if project_root not in sys.path:
 from imports.serial_commander.utils.command_parser import parse_response
 from imports.serial_commander.config.config_loader import load_esp32config
 
-default_config = load_esp32config().get('ESP32_UART_CONFIG')
+# Kept for backward compatibility; the UART config is now resolved in SerialCommunication.__init__
+default_config = None
+
+# Marker that opens every ESP32 response line
+_RESPONSE_TOKEN = b"RESPONSE:"
 
 class SerialCommunication:
     def __init__(self, config: Optional[Dict] = default_config, logger: Optional[logging.Logger] = None,
-                 max_retries: int = 3, retry_delay: float = 0.5):
+                 max_retries: int = 3, retry_delay: float = 0.5, max_retry_delay: float = 5.0):
         """Initialize serial communication with retry parameters.
 
         Args:
+            config: UART configuration (default: ESP32_UART_CONFIG from esp32_config.json)
             logger: Optional logger instance
             max_retries: Maximum number of command retries (default: 3)
-            retry_delay: Delay between retries in seconds (default: 0.5)
+            retry_delay: Base delay between retries in seconds, doubled on each attempt (default: 0.5)
+            max_retry_delay: Upper bound on the delay between retries in seconds (default: 5.0)
         """
         self.serial_port = None
         self.last_response = None
         self.logger = logger or logging.getLogger(__name__)
-        self.uart_config = config
+        self.uart_config = config or dict(load_esp32config()['ESP32_UART_CONFIG'])
+        self._term_bytes = self.uart_config['LINE_TERMINATOR'].encode('utf-8')
+        self._timeout = self.uart_config['TIMEOUT']
+        self._post_write_delay = self.uart_config.get('POST_WRITE_DELAY', 0)
+        # Direct fd reads are only possible with pyserial's POSIX backend
+        self._use_lowlevel_io = self.uart_config.get('USE_LOWLEVEL_IO', False) and os.name == 'posix'
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        # True when no unread data is expected in the input buffer
+        self._stream_clean = False
 
     def open_serial(self, port: str = None) -> None:
         """
@@ -61,20 +77,29 @@ class SerialCommunication:
             self.serial_port.dtr = False
             self.serial_port.rts = False
 
+            if self.uart_config.get('LOW_LATENCY', False):
+                self._enable_low_latency()
+
             # Wait for ESP32 to stabilize
             time.sleep(self.uart_config['ESP32_BOOT_DELAY'])  # Give ESP32 time to complete its boot sequence
 
-            # Clear buffers
+            # Clear buffers, discarding any boot chatter received so far
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
-
-            # Read any pending data
-            while self.serial_port.in_waiting:
-                self.serial_port.read_all()
-                time.sleep(0.1)
+            self._stream_clean = True
 
             self.logger.info(f"Serial port {port} opened successfully")
 
+    def _enable_low_latency(self) -> None:
+        """Ask the USB-serial driver to deliver bytes without its default latency timer.
+
+        Only supported by pyserial on POSIX; elsewhere the request is logged and ignored.
+        """
+        try:
+            self.serial_port.set_low_latency_mode(True)
+        except (AttributeError, OSError, NotImplementedError, ValueError) as e:
+            self.logger.debug(f"Low latency mode unavailable: {str(e)}")
+
     def close_serial(self) -> None:
         """Close serial connection if open."""
         if self.serial_port and self.serial_port.is_open:
@@ -95,13 +120,17 @@ class SerialCommunication:
         """
         try:
             self._ensure_connection()
-            self._clear_pending_data()
+
+            # Only flush stale input on retries or after an incomplete read
+            if retry_count > 0 or not self._stream_clean:
+                self._clear_pending_data()
+            self._stream_clean = False
 
             # Log the command and retry attempt if applicable
             if retry_count > 0:
-                self.logger.debug(f"Retry attempt {retry_count}/{self.max_retries} for command: {command}")
+                self.logger.debug("Retry attempt %d/%d for command: %s", retry_count, self.max_retries, command)
             else:
-                self.logger.debug(f"Sending command: [{command}]")
+                self.logger.debug("Sending command: [%s]", command)
 
             self._send_command(command)
 
@@ -135,15 +164,17 @@ class SerialCommunication:
 
     def _send_command(self, command: str) -> None:
         """
-        Send the command and wait for a response.
+        Send the command over the serial port.
 
         Args:
             command: Command to send
         """
-        command_bytes = (command + self.uart_config['LINE_TERMINATOR']).encode('utf-8')
-        self.serial_port.write(command_bytes)
+        self.serial_port.write(command.encode('utf-8') + self._term_bytes)
         self.serial_port.flush()
-        time.sleep(0.1)
+
+        # Optional settle time for firmware that needs a gap after each command
+        if self._post_write_delay:
+            time.sleep(self._post_write_delay)
 
     def _read_response(self) -> str:
         """
@@ -152,27 +183,106 @@ class SerialCommunication:
         Returns:
             str: Response from the serial port
         """
-        response = ""
-        start_time = time.time()
-
-        while time.time() - start_time < self.uart_config['TIMEOUT']:
-            if self.serial_port.in_waiting:
-                try:
-                    new_data = self.serial_port.read_all().decode('utf-8', errors='ignore')
-                    response += new_data
-
-                    # Check if we have a complete response
-                    if "RESPONSE:" in response and self.uart_config['LINE_TERMINATOR'] in response:
-                        break
-                except UnicodeDecodeError:
-                    # If we get invalid UTF-8, clear the buffer and continue
-                    self.serial_port.reset_input_buffer()
-                    self.logger.warning("Received invalid UTF-8 data, clearing buffer")
+        if self._use_lowlevel_io:
+            return self._read_response_lowlevel()
+
+        buffer = bytearray()
+        token_pos = -1
+        scan_pos = 0
+        deadline = time.monotonic() + self._timeout
+        timeout_shrunk = False
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                # The first read waits on the configured port timeout, which matches the
+                # deadline. Changing the timeout reconfigures the driver, so shrink it at
+                # most once, before the first follow-up read, to avoid overrunning TIMEOUT.
+                if buffer and not timeout_shrunk:
+                    self.serial_port.timeout = remaining
+                    timeout_shrunk = True
+
+                # Block for the first byte, then drain everything already buffered in one read
+                chunk = self.serial_port.read(1)
+                if not chunk:
+                    continue
+                buffer.extend(chunk)
+
+                waiting = self.serial_port.in_waiting
+                if waiting:
+                    buffer.extend(self.serial_port.read(waiting))
+
+                # Search only the newly read bytes (plus overlap): first for the header,
+                # then for the terminator that closes its line
+                if token_pos == -1:
+                    token_pos = buffer.find(_RESPONSE_TOKEN, scan_pos)
+                    if token_pos == -1:
+                        scan_pos = max(0, len(buffer) - len(_RESPONSE_TOKEN) + 1)
+                        continue
+                    scan_pos = token_pos
+
+                if buffer.find(self._term_bytes, scan_pos) != -1:
+                    self._stream_clean = True
+                    break
+                scan_pos = max(token_pos, len(buffer) - len(self._term_bytes) + 1)
+        finally:
+            # Restore the configured port timeout for other readers
+            if timeout_shrunk:
+                self.serial_port.timeout = self._timeout
+
+        return buffer.decode('utf-8', errors='ignore')
+
+    def _read_response_lowlevel(self) -> str:
+        """
+        Read the response straight from the port's file descriptor.
+
+        select() blocks until bytes arrive and each wakeup drains them with a single
+        os.read(), bypassing pyserial's read loop. POSIX only.
+
+        Returns:
+            str: Response from the serial port
+        """
+        fd = self.serial_port.fileno()
+        buffer = bytearray()
+        token_pos = -1
+        scan_pos = 0
+        deadline = time.monotonic() + self._timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+
+            try:
+                chunk = os.read(fd, 4096)
+            except BlockingIOError:
+                continue
+            if not chunk:
+                raise serial.SerialException("device reports readiness to read but returned no data")
+            buffer.extend(chunk)
+
+            # Search only the newly read bytes (plus overlap): first for the header,
+            # then for the terminator that closes its line
+            if token_pos == -1:
+                token_pos = buffer.find(_RESPONSE_TOKEN, scan_pos)
+                if token_pos == -1:
+                    scan_pos = max(0, len(buffer) - len(_RESPONSE_TOKEN) + 1)
                     continue
+                scan_pos = token_pos
 
-            time.sleep(0.05)  # Small delay to prevent busy waiting
+            if buffer.find(self._term_bytes, scan_pos) != -1:
+                self._stream_clean = True
+                break
+            scan_pos = max(token_pos, len(buffer) - len(self._term_bytes) + 1)
 
-        return response
+        return buffer.decode('utf-8', errors='ignore')
 
     def _ensure_connection(self) -> None:
         """Ensure the serial connection is open."""
@@ -210,7 +320,9 @@ class SerialCommunication:
         """
         if retry_count < self.max_retries:
             self.logger.warning(f"Command failed, attempting retry {retry_count + 1}/{self.max_retries}")
-            time.sleep(self.retry_delay)  # Wait before retry
+            # Exponential backoff with jitter, capped at max_retry_delay
+            delay = min(self.max_retry_delay, self.retry_delay * (2 ** retry_count))
+            time.sleep(delay * (0.5 + random.random() * 0.5))
             return self.send_command(command, retry_count + 1, context)
         else:
             self.logger.error(f"Command failed after {self.max_retries} retries")
@@ -228,7 +340,7 @@ class SerialCommunication:
         parsed = parse_response(response, self.logger)
 
         if parsed:
-            self.logger.debug(f"Parsed response: {parsed}")
+            self.logger.debug("Parsed response: %s", parsed)
             if parsed['status'] == 'OK':
                 self.logger.debug("Response status is OK.")
                 return True
@@ -0,0 +1,134 @@
+import asyncio
+import unittest
+import sys
+import os
+from unittest import mock
+
+# Add the project root to sys.path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from imports.serial_commander import async_serial_communication
+from imports.serial_commander.async_serial_communication import AsyncSerialCommunication
+
+TEST_CONFIG = {
+    'DEFAULT_PORT': 'FAKE0',
+    'BAUD_RATE': 115200,
+    'TIMEOUT': 0.5,
+    'LINE_TERMINATOR': '\n',
+    'ESP32_BOOT_DELAY': 0
+}
+
+class FakeSerial:
+    """Stand-in for the pyserial port exposed as transport.serial."""
+
+    def __init__(self):
+        self.dtr = True
+        self.rts = True
+
+class FakeTransport:
+    """Transport that answers each write with the queued reply chunks."""
+
+    def __init__(self, protocol, replies):
+        self.protocol = protocol
+        self.replies = replies
+        self.serial = FakeSerial()
+        self.written = []
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        loop = asyncio.get_running_loop()
+        for chunk in self.replies:
+            loop.call_soon(self.protocol.data_received, chunk)
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+
+class FakeSerialAsyncio:
+    """Mimics serial_asyncio: connection_made is only scheduled, not called inline."""
+
+    def __init__(self, replies=()):
+        self.replies = list(replies)
+        self.transport = None
+
+    async def create_serial_connection(self, loop, protocol_factory, port, **kwargs):
+        protocol = protocol_factory()
+        self.transport = FakeTransport(protocol, self.replies)
+        loop.call_soon(protocol.connection_made, self.transport)
+        return self.transport, protocol
+
+class AsyncSerialCommunicationTest(unittest.TestCase):
+    def _run(self, fake, coro_factory):
+        with mock.patch.object(async_serial_communication, 'serial_asyncio', fake):
+            return asyncio.run(coro_factory())
+
+    def test_open_serial_uses_returned_transport(self):
+        fake = FakeSerialAsyncio()
+
+        async def scenario():
+            async with AsyncSerialCommunication(config=TEST_CONFIG) as comm:
+                return comm.transport
+
+        transport = self._run(fake, scenario)
+
+        self.assertIs(transport, fake.transport)
+        self.assertFalse(transport.serial.dtr)
+        self.assertFalse(transport.serial.rts)
+        self.assertTrue(transport.closed)
+
+    def test_send_command_with_fragmented_response(self):
+        fake = FakeSerialAsyncio([b"boot\nRESP", b"ONSE: GPIO_OUTPUT, PIN: 2", b"7, STATUS: OK", b"\n"])
+
+        async def scenario():
+            async with AsyncSerialCommunication(config=TEST_CONFIG) as comm:
+                return await comm.send_command("SET 27 1"), comm.last_response
+
+        success, last_response = self._run(fake, scenario)
+
+        self.assertTrue(success)
+        self.assertEqual(last_response, "boot\nRESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n")
+        self.assertEqual(fake.transport.written, [b"SET 27 1\n"])
+
+    def test_send_command_with_split_multibyte_terminator(self):
+        fake = FakeSerialAsyncio([b"RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r", b"\n"])
+
+        async def scenario():
+            async with AsyncSerialCommunication(config=dict(TEST_CONFIG, LINE_TERMINATOR='\r\n')) as comm:
+                return await comm.send_command("LOOP 3"), comm.last_response
+
+        success, last_response = self._run(fake, scenario)
+
+        self.assertTrue(success)
+        self.assertEqual(last_response, "RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r\n")
+
+    def test_unsolicited_output_is_not_buffered(self):
+        fake = FakeSerialAsyncio([b"RESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n"])
+
+        async def scenario():
+            async with AsyncSerialCommunication(config=TEST_CONFIG) as comm:
+                for _ in range(1000):
+                    comm.data_received(b"STATUS: idle\n")
+                buffered = len(comm._buffer)
+                return buffered, await comm.send_command("SET 27 1")
+
+        buffered, success = self._run(fake, scenario)
+
+        self.assertEqual(buffered, 0)
+        self.assertTrue(success)
+
+    def test_send_command_times_out_without_response(self):
+        fake = FakeSerialAsyncio([b"RESPONSE: GPIO_OUTPUT, PIN: 27"])
+
+        async def scenario():
+            async with AsyncSerialCommunication(config=dict(TEST_CONFIG, TIMEOUT=0.05)) as comm:
+                return await comm.send_command("SET 27 1")
+
+        self.assertFalse(self._run(fake, scenario))
+
+if __name__ == '__main__':
+    unittest.main()
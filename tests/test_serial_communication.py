@@ -0,0 +1,262 @@
+import time
+import threading
+import unittest
+import sys
+import os
+
+# Add the project root to sys.path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from imports.serial_commander.serial_communication import SerialCommunication
+
+TEST_CONFIG = {
+    'DEFAULT_PORT': 'FAKE0',
+    'BAUD_RATE': 115200,
+    'TIMEOUT': 0.5,
+    'LINE_TERMINATOR': '\n',
+    'ESP32_BOOT_DELAY': 0
+}
+
+class FakePort:
+    """In-memory stand-in for serial.Serial.
+
+    Each write queues the next scripted reply, a list of chunks given either as bytes
+    or as (delay, bytes) with the delay counted from the write. A read on empty input
+    waits for the next chunk to arrive, or returns nothing after the timeout.
+    """
+
+    def __init__(self, replies):
+        self.replies = [list(reply) for reply in replies]
+        self.arrivals = []
+        self.pending = bytearray()
+        self.written = []
+        self.resets = 0
+        self.timeout_sets = 0
+        self._timeout = TEST_CONFIG['TIMEOUT']
+        self.is_open = True
+
+    @property
+    def timeout(self):
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, value):
+        # pyserial reconfigures the driver on every assignment
+        self.timeout_sets += 1
+        self._timeout = value
+
+    @property
+    def in_waiting(self):
+        return len(self.pending)
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        if self.replies:
+            now = time.monotonic()
+            for item in self.replies.pop(0):
+                delay, chunk = item if isinstance(item, tuple) else (0, item)
+                self.arrivals.append((now + delay, chunk))
+
+    def flush(self) -> None:
+        pass
+
+    def read(self, size: int = 1) -> bytes:
+        if not self.pending:
+            if not self.arrivals:
+                time.sleep(self._timeout)
+                return b""
+            due, chunk = self.arrivals[0]
+            wait = due - time.monotonic()
+            if wait > self._timeout:
+                time.sleep(self._timeout)
+                return b""
+            if wait > 0:
+                time.sleep(wait)
+            self.arrivals.pop(0)
+            self.pending.extend(chunk)
+        data = bytes(self.pending[:size])
+        del self.pending[:size]
+        return data
+
+    def reset_input_buffer(self) -> None:
+        self.resets += 1
+        self.pending.clear()
+        self.arrivals.clear()
+
+class PipePort:
+    """Fake port backed by an OS pipe, for the USE_LOWLEVEL_IO path.
+
+    Replies use the same chunk format as FakePort; delayed chunks are written from timers.
+    """
+
+    def __init__(self, replies):
+        self.replies = [list(reply) for reply in replies]
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._read_fd, False)
+        self._timers = []
+        self.written = []
+        self.resets = 0
+        self.is_open = True
+
+    def fileno(self) -> int:
+        return self._read_fd
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        if self.replies:
+            for item in self.replies.pop(0):
+                delay, chunk = item if isinstance(item, tuple) else (0, item)
+                timer = threading.Timer(delay, os.write, (self._write_fd, chunk))
+                self._timers.append(timer)
+                timer.start()
+
+    def flush(self) -> None:
+        pass
+
+    def reset_input_buffer(self) -> None:
+        self.resets += 1
+        try:
+            while os.read(self._read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        for timer in self._timers:
+            timer.join()
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+def make_comm(replies, config=None, port_class=None, **kwargs):
+    comm = SerialCommunication(config=dict(TEST_CONFIG, **(config or {})), retry_delay=0, **kwargs)
+    comm.serial_port = (port_class or FakePort)(replies)
+    # open_serial leaves a freshly flushed port behind
+    comm._stream_clean = True
+    return comm
+
+class ConfigTest(unittest.TestCase):
+    def test_default_config_is_a_private_copy(self):
+        comm = SerialCommunication()
+        comm.uart_config['DEFAULT_PORT'] = 'CHANGED'
+
+        self.assertNotEqual(SerialCommunication().uart_config['DEFAULT_PORT'], 'CHANGED')
+
+class ReadResponseTest(unittest.TestCase):
+    def test_split_multibyte_terminator(self):
+        comm = make_comm([[b"RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r", b"\n"]],
+                         config={'LINE_TERMINATOR': '\r\n'}, max_retries=0)
+
+        start = time.monotonic()
+        success = comm.send_command("LOOP 3")
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(success)
+        self.assertLess(elapsed, TEST_CONFIG['TIMEOUT'])
+        self.assertEqual(comm.last_response, "RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r\n")
+        self.assertTrue(comm._stream_clean)
+
+    def test_single_chunk_reply_leaves_port_timeout_alone(self):
+        comm = make_comm([[b"RESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n"]], max_retries=0)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertEqual(comm.serial_port.timeout_sets, 0)
+
+    def test_port_timeout_shrunk_at_most_once(self):
+        comm = make_comm([[b"boot\n", b"RESP", b"ONSE: GPIO_OUTPUT, PIN: 2", b"7, STATUS: OK\n"]], max_retries=0)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        # One shrink and one restore, however many chunks the reply took
+        self.assertEqual(comm.serial_port.timeout_sets, 2)
+        self.assertEqual(comm.serial_port.timeout, TEST_CONFIG['TIMEOUT'])
+
+    def test_late_partial_line_does_not_overrun_timeout(self):
+        comm = make_comm([[(0.45, b"noise\n")]], max_retries=0)
+
+        start = time.monotonic()
+        self.assertFalse(comm.send_command("SET 27 1"))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, TEST_CONFIG['TIMEOUT'] + 0.1)
+        self.assertFalse(comm._stream_clean)
+
+class StreamCleanTest(unittest.TestCase):
+    OK_REPLY = [b"RESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n"]
+
+    def test_clean_read_skips_reset(self):
+        comm = make_comm([self.OK_REPLY, self.OK_REPLY], max_retries=0)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertTrue(comm.send_command("SET 27 0"))
+        self.assertEqual(comm.serial_port.resets, 0)
+
+    def test_partial_line_forces_reset_on_next_command(self):
+        comm = make_comm([[b"RESPONSE: GPIO_OUTPUT, PIN: 27"], self.OK_REPLY],
+                         config={'TIMEOUT': 0.1}, max_retries=0)
+
+        self.assertFalse(comm.send_command("SET 27 1"))
+        self.assertFalse(comm._stream_clean)
+        self.assertEqual(comm.serial_port.resets, 0)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertEqual(comm.serial_port.resets, 1)
+
+    def test_timeout_forces_reset_on_next_command(self):
+        comm = make_comm([[], self.OK_REPLY], config={'TIMEOUT': 0.1}, max_retries=0)
+
+        self.assertFalse(comm.send_command("SET 27 1"))
+        self.assertFalse(comm._stream_clean)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertEqual(comm.serial_port.resets, 1)
+
+    def test_retry_always_resets(self):
+        comm = make_comm([[b"RESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: ERR\n"], self.OK_REPLY], max_retries=1)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertEqual(comm.serial_port.written, [b"SET 27 1\n", b"SET 27 1\n"])
+        # The failed read was complete, so only the retry itself flushed the input
+        self.assertEqual(comm.serial_port.resets, 1)
+
+@unittest.skipUnless(os.name == 'posix', "USE_LOWLEVEL_IO is POSIX only")
+class LowLevelReadTest(unittest.TestCase):
+    def _make_comm(self, replies, config=None, **kwargs):
+        comm = make_comm(replies, config=dict(config or {}, USE_LOWLEVEL_IO=True), port_class=PipePort, **kwargs)
+        self.addCleanup(comm.serial_port.close)
+        return comm
+
+    def test_split_multibyte_terminator(self):
+        comm = self._make_comm([[b"RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r", (0.02, b"\n")]],
+                               config={'LINE_TERMINATOR': '\r\n'}, max_retries=0)
+
+        start = time.monotonic()
+        success = comm.send_command("LOOP 3")
+        elapsed = time.monotonic() - start
+
+        self.assertTrue(success)
+        self.assertLess(elapsed, TEST_CONFIG['TIMEOUT'])
+        self.assertEqual(comm.last_response, "RESPONSE: CLOSED_LOOP, ID: 3, STATUS: OK\r\n")
+        self.assertTrue(comm._stream_clean)
+
+    def test_clean_read_skips_reset(self):
+        reply = [b"boot\nRESP", (0.01, b"ONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n")]
+        comm = self._make_comm([reply, reply], max_retries=0)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertTrue(comm.send_command("SET 27 0"))
+        self.assertEqual(comm.serial_port.resets, 0)
+
+    def test_partial_line_forces_reset_on_next_command(self):
+        comm = self._make_comm([[b"RESPONSE: GPIO_OUTPUT, PIN: 27"],
+                                [b"RESPONSE: GPIO_OUTPUT, PIN: 27, STATUS: OK\n"]],
+                               config={'TIMEOUT': 0.1}, max_retries=0)
+
+        self.assertFalse(comm.send_command("SET 27 1"))
+        self.assertFalse(comm._stream_clean)
+
+        self.assertTrue(comm.send_command("SET 27 1"))
+        self.assertEqual(comm.serial_port.resets, 1)
+
+if __name__ == '__main__':
+    unittest.main()
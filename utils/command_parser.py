@@ -1,8 +1,44 @@
 import re
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Pattern, Tuple
 from ..config.config_loader import load_esp32config
 
+@lru_cache(maxsize=None)
+def _compiled_patterns() -> Tuple[Pattern, Dict[str, slice]]:
+    """Compile the configured response patterns on first use.
+
+    Every pattern is folded into one alternation of named groups, so a single match
+    both validates and classifies a line. Deferring this keeps importing the module
+    free of config file I/O.
+
+    Returns:
+        Tuple[Pattern, Dict[str, slice]]: The combined pattern, and for each response
+        type the slice of match.groups() holding its own capture groups
+    """
+    patterns = load_esp32config()['ESP32_RESPONSE_PATTERNS']
+    master = re.compile('|'.join(f'(?P<{response_type}>{pattern})' for response_type, pattern in patterns.items()))
+    group_slices = {
+        response_type: slice(master.groupindex[response_type],
+                             master.groupindex[response_type] + re.compile(pattern).groups)
+        for response_type, pattern in patterns.items()
+    }
+    return master, group_slices
+
+# Matches a "RESPONSE: " line, ignoring leading whitespace
+_RESPONSE_LINE = re.compile(r'^[^\S\n]*(RESPONSE: [^\n]*)', re.MULTILINE)
+
+# Builds the parsed result for each response type from its capture groups
+_BUILDERS = {
+    'GPIO_OUTPUT': lambda g: {'type': 'GPIO_OUTPUT', 'pin': int(g[0]), 'status': g[1]},
+    'GPIO_INPUT': lambda g: {'type': 'GPIO_INPUT', 'pin': int(g[0]), 'value': g[1], 'status': g[2]},
+    'PWM_OUTPUT': lambda g: {'type': 'PWM_OUTPUT', 'pin': int(g[0]), 'status': g[1]},
+    'DAC_OUTPUT': lambda g: {'type': 'DAC_OUTPUT', 'pin': int(g[0]), 'status': g[1]},
+    'ADC_INPUT': lambda g: {'type': 'ADC_INPUT', 'pin': int(g[0]), 'value': int(g[1]), 'status': g[2]},
+    'GEN_SIGNAL': lambda g: {'type': 'GEN_SIGNAL', 'signal_type': int(g[0]), 'value': float(g[1]), 'status': g[2]},
+    'CLOSED_LOOP': lambda g: {'type': 'CLOSED_LOOP', 'id': int(g[0]), 'status': g[1]},
+}
+
 def parse_response(response, logger: Optional[logging.Logger] = None):
     """Parse the response from ESP32.
 
@@ -23,94 +59,33 @@ def parse_response(response, logger: Optional[logging.Logger] = None):
         logger.error("No response provided for parsing.")
         return None
 
-    # Split response into lines and look for the actual response line
-    lines = response.split('\n')
-    valid_responses = []
+    master, group_slices = _compiled_patterns()
 
-    for line in lines:
-        line = line.strip()
+    # Classify "RESPONSE: " lines as the scan finds them and stop at the first match
+    found_response_line = False
+    for candidate in _RESPONSE_LINE.finditer(response):
+        found_response_line = True
+        line = candidate.group(1).rstrip()
 
-        # Only process lines that start with "RESPONSE: "
-        if line.startswith("RESPONSE: "):
-            valid_responses.append(line)  # Collect valid response lines
-        else:
-            logger.debug(f"Ignoring line: {line}")  # Log ignored lines
+        logger.debug("Parsing valid response: %s", line)  # Log the response being parsed
+
+        match = master.match(line)
+        if match:
+            response_type = match.lastgroup
+            groups = match.groups()[group_slices[response_type]]
+            logger.debug("Matched response type: %s with groups: %s", response_type, groups)  # Log matched response
+
+            builder = _BUILDERS.get(response_type)
+            if builder is None:
+                logger.warning(f"No handler for response type: {response_type}")
+                continue
+
+            return builder(groups)
 
     # Add validation for no valid responses found
-    if not valid_responses:
+    if not found_response_line:
         logger.warning("No valid response lines found in the input")
         return None
 
-    # Process collected valid response lines
-    for line in valid_responses:
-
-        logger.debug(f"Parsing valid response: {line}")  # Log the response being parsed
-
-        for response_type, pattern in load_esp32config().get('ESP32_RESPONSE_PATTERNS').items():
-            match = re.match(pattern, line)
-            if match:
-                groups = match.groups()
-                logger.debug(f"Matched response type: {response_type} with groups: {groups}")  # Log matched response
-
-                # Handle different response types
-                if response_type == 'GPIO_OUTPUT':
-                    pin, status = groups
-                    return {
-                        'type': 'GPIO_OUTPUT',
-                        'pin': int(pin),
-                        'status': status
-                    }
-
-                elif response_type == 'GPIO_INPUT':
-                    pin, value, status = groups
-                    return {
-                        'type': 'GPIO_INPUT',
-                        'pin': int(pin),
-                        'value': value,
-                        'status': status
-                    }
-
-                elif response_type == 'PWM_OUTPUT':
-                    pin, status = groups
-                    return {
-                        'type': 'PWM_OUTPUT',
-                        'pin': int(pin),
-                        'status': status
-                    }
-
-                elif response_type == 'DAC_OUTPUT':
-                    pin, status = groups
-                    return {
-                        'type': 'DAC_OUTPUT',
-                        'pin': int(pin),
-                        'status': status
-                    }
-
-                elif response_type == 'ADC_INPUT':
-                    pin, value, status = groups
-                    return {
-                        'type': 'ADC_INPUT',
-                        'pin': int(pin),
-                        'value': int(value),
-                        'status': status
-                    }
-
-                elif response_type == 'GEN_SIGNAL':
-                    sig_type, value, status = groups
-                    return {
-                        'type': 'GEN_SIGNAL',
-                        'signal_type': int(sig_type),
-                        'value': float(value),
-                        'status': status
-                    }
-
-                elif response_type == 'CLOSED_LOOP':
-                    id_val, status = groups
-                    return {
-                        'type': 'CLOSED_LOOP',
-                        'id': int(id_val),
-                        'status': status
-                    }
-
     logger.error("No valid response matched.")
     return None
\ No newline at end of file